@@ -1,233 +1,578 @@
+import asyncio
+import atexit
 import boto3
+from aiolimiter import AsyncLimiter
+from botocore.client import BaseClient
+from botocore.config import Config
+from tqdm.asyncio import tqdm as atqdm
 import json
 import base64
+import contextlib
+import functools
+import hashlib
+import ijson
+import logging
+import logging.handlers
 import os
+import queue
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-import time
+from typing import Tuple
+
+class _TqdmStreamHandler(logging.StreamHandler):
+    """Stream handler that writes around any active tqdm progress bar"""
+    
+    def emit(self, record):
+        try:
+            # tqdm.write clears and redraws live bars under tqdm's lock, so
+            # log lines never splice into a bar that is being refreshed
+            atqdm.write(self.format(record), file=self.stream)
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+# Log records are queued by the calling thread and written to stdout by a
+# single listener thread, so concurrent generations never contend for stdout
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.Queue(-1)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_stream_handler = _TqdmStreamHandler(sys.stdout)
+_stream_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+def _flush_logs():
+    """Write out queued log records, e.g. before prompting for console input"""
+    _log_listener.stop()
+    _log_listener.start()
+
+# orjson is considerably faster than the standard library; both produce the
+# same compact encoding, so request bodies and cache keys match either way
+try:
+    import orjson
+    
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+# Nova Canvas returns at most this many images per TEXT_IMAGE request
+MAX_IMAGES_PER_REQUEST = 5
+
+# Nova Canvas limits on generated image dimensions and guidance scale
+MIN_IMAGE_SIDE = 320
+MAX_IMAGE_SIDE = 4096
+MAX_IMAGE_PIXELS = 4194304
+MIN_CFG_SCALE = 1.1
+MAX_CFG_SCALE = 10.0
+
+
+def _validate_generation_config(width, height, cfg_scale):
+    """Raise TypeError or ValueError for settings Nova Canvas would reject"""
+    for name, side in (('width', width), ('height', height)):
+        # Floats like 1024.0 would pass the range checks but change the
+        # serialized request body
+        if isinstance(side, bool) or not isinstance(side, int):
+            raise TypeError(f"{name} must be an int, got {side!r}")
+        if not MIN_IMAGE_SIDE <= side <= MAX_IMAGE_SIDE or side % 16:
+            raise ValueError(
+                f"{name} must be a multiple of 16 between {MIN_IMAGE_SIDE} and {MAX_IMAGE_SIDE}, got {side}"
+            )
+    if width * height > MAX_IMAGE_PIXELS:
+        raise ValueError(f"width * height must be at most {MAX_IMAGE_PIXELS} pixels, got {width * height}")
+    if not 0.25 <= width / height <= 4:
+        raise ValueError(f"aspect ratio must be between 1:4 and 4:1, got {width}:{height}")
+    if isinstance(cfg_scale, bool) or not isinstance(cfg_scale, (int, float)):
+        raise TypeError(f"cfg_scale must be a number, got {cfg_scale!r}")
+    if not MIN_CFG_SCALE <= cfg_scale <= MAX_CFG_SCALE:
+        raise ValueError(f"cfg_scale must be between {MIN_CFG_SCALE} and {MAX_CFG_SCALE}, got {cfg_scale}")
+
+
+# typed=True keeps e.g. 8 and 8.0 apart, as they serialize differently
+@functools.lru_cache(maxsize=None, typed=True)
+def _encode_generation_config(number_of_images, width, height, cfg_scale, seed):
+    """Serialize an imageGenerationConfig once per distinct setting"""
+    config = {
+        "numberOfImages": number_of_images,
+        "quality": "premium",
+        "width": width,
+        "height": height,
+        "cfgScale": cfg_scale
+    }
+    
+    # Add seed if provided
+    if seed is not None:
+        config["seed"] = seed
+    
+    return _dumps(config)
+
+
+def _encode_request_body(prompt, generation_config):
+    """Splice a prompt into a TEXT_IMAGE body around a pre-serialized config"""
+    return (
+        b'{"taskType":"TEXT_IMAGE","textToImageParams":{"text":' + _dumps(prompt)
+        + b'},"imageGenerationConfig":' + generation_config + b'}'
+    )
+
+
+# Read the umask once at import, before any worker threads exist: os.umask can
+# only be queried by setting it, which would race with concurrent file creation
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _write_file(path, data):
+    """
+    Atomically write bytes with raw os.write calls, bypassing buffered I/O
+    
+    A multi-MB image goes out in one write(2) instead of one per 8KB buffer.
+    The data goes to a temporary file in the same directory that is renamed
+    onto path only once complete, so an interrupted write (ENOSPC, Ctrl-C, a
+    crashed worker) never leaves a truncated file under the final name.
+    """
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix='.tmp', dir=directory or '.')
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            
+            # The images are not read back right away, so keep them out of the
+            # page cache where the platform supports it
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        
+        # mkstemp creates the file as 0600; match open(path, 'wb') instead
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _can_batch(a, b):
+    """
+    Check whether two prompt specs can share one TEXT_IMAGE request
+    
+    numberOfImages produces variations of a single prompt, so only specs with
+    the same text are batchable; a workshop run uses one set of generation
+    settings for every spec.
+    """
+    return a.prompt == b.prompt
+
+
+@functools.lru_cache(maxsize=8)
+def _get_client(region: str) -> BaseClient:
+    """
+    Return the shared bedrock-runtime client for a region
+    
+    botocore low-level clients are thread-safe, so one client (and its
+    connection pool, credentials and loaded service model) is reused by every
+    generator and worker thread instead of being rebuilt per instance.
+    """
+    # Adaptive retries back off client-side on throttling, and a larger
+    # keep-alive pool lets concurrent requests reuse TLS connections
+    config = Config(
+        retries={'mode': 'adaptive', 'max_attempts': 6},
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        connect_timeout=5,
+        read_timeout=120
+    )
+    return boto3.client(
+        service_name='bedrock-runtime',
+        region_name=region,
+        config=config
+    )
+
+
+@dataclass(frozen=True)
+class PromptSpec:
+    """A workshop image: its output filename, generation prompt and label"""
+    __slots__ = ('filename', 'prompt', 'description')
+    
+    filename: str
+    prompt: str
+    description: str
+
+
+# All prompts for the workshop
+PROMPTS: Tuple[PromptSpec, ...] = (
+    PromptSpec(
+        filename="01_basic_white_tshirt",
+        prompt="A clean white cotton t-shirt on a plain white background, front view, no wrinkles, studio lighting, product photography style, minimalist, high resolution",
+        description="Basic solid color t-shirt"
+    ),
+    PromptSpec(
+        filename="02_striped_longsleeve",
+        prompt="A navy blue and white horizontal striped long-sleeve shirt, crew neck, regular fit, laid flat on white background, professional product photo, even lighting",
+        description="Striped long-sleeve shirt"
+    ),
+    PromptSpec(
+        filename="03_checkered_buttonup",
+        prompt="A red and black checkered flannel button-up shirt, classic collar, long sleeves, regular fit, hanging on white background, studio photography",
+        description="Checkered button-up shirt"
+    ),
+    PromptSpec(
+        filename="04_oversized_hoodie",
+        prompt="An oversized gray hoodie sweatshirt with hood up, loose fit, kangaroo pocket, long sleeves, on plain background, casual streetwear style",
+        description="Oversized hoodie"
+    ),
+    PromptSpec(
+        filename="05_floral_blouse",
+        prompt="A light pink blouse with small white floral pattern, V-neck, short sleeves, fitted silhouette, on white background, feminine style, soft lighting",
+        description="Floral print blouse"
+    ),
+    PromptSpec(
+        filename="06_vintage_band_tshirt",
+        prompt="A black vintage-style band t-shirt with distressed graphic print, crew neck, short sleeves, slightly faded, relaxed fit, on neutral background",
+        description="Vintage band t-shirt"
+    ),
+    PromptSpec(
+        filename="07_formal_dress_shirt",
+        prompt="A crisp white formal dress shirt, French cuffs, spread collar, long sleeves, slim fit, pressed and neat, professional product photography",
+        description="Formal dress shirt"
+    ),
+    PromptSpec(
+        filename="08_crop_top",
+        prompt="A bright yellow crop top, sleeveless, scoop neckline, fitted style, modern casual wear, on clean white background, good lighting",
+        description="Crop top"
+    ),
+    PromptSpec(
+        filename="09_turtleneck_sweater",
+        prompt="A burgundy turtleneck sweater, long sleeves, fitted silhouette, ribbed texture, fall/winter style, on neutral background, cozy aesthetic",
+        description="Turtleneck sweater"
+    ),
+    PromptSpec(
+        filename="10_tiedye_tshirt",
+        prompt="A tie-dye t-shirt with rainbow spiral pattern, crew neck, short sleeves, regular fit, vibrant colors, casual hippie style, bright lighting",
+        description="Tie-dye t-shirt"
+    ),
+)
+
 
 class NovaCanvasImageGenerator:
-    def __init__(self, region_name='us-east-1'):
-        """Initialize the Nova Canvas image generator"""
-        self.bedrock_runtime = boto3.client(
-            service_name='bedrock-runtime',
-            region_name=region_name
-        )
+    def __init__(self, region_name='us-east-1', max_parallel_requests=None, requests_per_second=5,
+                 width=1024, height=1024, cfg_scale=8.0):
+        """
+        Initialize the Nova Canvas image generator
+        
+        Args:
+            region_name (str): AWS region hosting Bedrock
+            max_parallel_requests (int): Worker threads used for concurrent
+                Bedrock calls; defaults to min(#prompts, cpu_count * 5)
+            requests_per_second (float): Token-bucket rate for Bedrock calls;
+                fractional rates below 1 are allowed
+            width (int): Image width in pixels, shared by every request
+            height (int): Image height in pixels, shared by every request
+            cfg_scale (float): Classifier-free guidance scale (1.1 to 10.0)
+        
+        Raises:
+            TypeError: If width or height is not an int, or cfg_scale is not
+                a number
+            ValueError: If the image settings are outside Nova Canvas limits,
+                max_parallel_requests is less than 1, or requests_per_second
+                is not positive
+        """
+        # Reject bad settings here rather than per request on the server
+        _validate_generation_config(width, height, cfg_scale)
+        if max_parallel_requests is not None and max_parallel_requests < 1:
+            raise ValueError(f"max_parallel_requests must be at least 1, got {max_parallel_requests}")
+        if (isinstance(requests_per_second, bool) or not isinstance(requests_per_second, (int, float))
+                or not requests_per_second > 0):
+            raise ValueError(f"requests_per_second must be a positive number, got {requests_per_second!r}")
+        self.width = width
+        self.height = height
+        self.cfg_scale = cfg_scale
+        
+        self.bedrock_runtime = _get_client(region_name)
         self.model_id = 'amazon.nova-canvas-v1:0'
+        self.max_parallel_requests = max_parallel_requests
+        
+        # Paces requests to the Bedrock RPS limit without a fixed delay; the
+        # limiter is bound to an event loop, so it is created per loop
+        self.requests_per_second = requests_per_second
+        self._limiter = None
+        self._limiter_loop = None
         
         # Create output directory if it doesn't exist
         self.output_dir = 'images'
         os.makedirs(self.output_dir, exist_ok=True)
         
-    def generate_image(self, prompt, filename, width=1024, height=1024, cfg_scale=8.0, seed=None):
+        # Generated images are cached by a hash of their request
+        self.cache_dir = os.path.join(self.output_dir, '.cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+    def _get_limiter(self):
+        """Return the rate limiter for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._limiter_loop is not loop:
+            # aiolimiter cannot acquire a whole request from a bucket smaller
+            # than 1, so slow rates become one request per 1/rate seconds
+            if self.requests_per_second >= 1:
+                self._limiter = AsyncLimiter(max_rate=self.requests_per_second, time_period=1)
+            else:
+                self._limiter = AsyncLimiter(max_rate=1, time_period=1 / self.requests_per_second)
+            self._limiter_loop = loop
+        return self._limiter
+    
+    async def generate_image(self, prompt, filename, seed=None, executor=None):
         """
         Generate a single image using Amazon Nova Canvas
         
+        Image size and guidance scale come from the generator's settings.
+        
         Args:
             prompt (str): The text prompt for image generation
             filename (str): Output filename (without extension)
-            width (int): Image width in pixels
-            height (int): Image height in pixels
-            cfg_scale (float): Classifier-free guidance scale (1.1 to 10.0)
             seed (int): Random seed for reproducibility
+            executor (Executor): Thread pool for the boto3 call; defaults to
+                the event loop's default executor
+        
+        Returns:
+            str: Path of the saved image, or None on failure
+        """
+        output_paths = await self.generate_images(
+            prompt, [filename], seed=seed, executor=executor
+        )
+        return output_paths[0] if output_paths else None
+    
+    async def generate_images(self, prompt, filenames, seed=None, executor=None):
+        """
+        Generate one or more images for a prompt in a single Nova Canvas call
+        
+        The blocking boto3 call runs in a worker thread so several requests can
+        be in flight concurrently. Results are cached on disk keyed by the
+        request, so an unchanged prompt and configuration is not re-generated.
+        
+        Args:
+            prompt (str): The text prompt for image generation
+            filenames (list): Output filenames (without extension), one per
+                image; at most MAX_IMAGES_PER_REQUEST
+            seed (int): Random seed for reproducibility
+            executor (Executor): Thread pool for the boto3 call; defaults to
+                the event loop's default executor
+        
+        Returns:
+            list: Paths of the saved images, empty on failure
         """
+        label = ", ".join(filenames)
         try:
             # Prepare the request body
-            request_body = {
-                "taskType": "TEXT_IMAGE",
-                "textToImageParams": {
-                    "text": prompt,
-                },
-                "imageGenerationConfig": {
-                    "numberOfImages": 1,
-                    "quality": "premium",
-                    "width": width,
-                    "height": height,
-                    "cfgScale": cfg_scale
-                }
-            }
+            request_body = _encode_request_body(
+                prompt, _encode_generation_config(len(filenames), self.width, self.height, self.cfg_scale, seed)
+            )
+            
+            output_paths = [os.path.join(self.output_dir, f"{filename}.png") for filename in filenames]
+            
+            # Any change to the model or request parameters yields a new key
+            cache_key = hashlib.sha256(self.model_id.encode() + request_body).hexdigest()
+            cache_paths = [
+                os.path.join(self.cache_dir, f"{cache_key}_{i}.png") for i in range(len(filenames))
+            ]
             
-            # Add seed if provided
-            if seed is not None:
-                request_body["imageGenerationConfig"]["seed"] = seed
+            # Cache hits are copied in a worker thread, like fresh results
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(executor, functools.partial(
+                self._restore_cached, cache_paths, output_paths
+            )):
+                return output_paths
             
-            print(f"Generating image: {filename}")
-            print(f"Prompt: {prompt[:100]}...")
+            logger.info("Generating image: %s", label)
+            logger.info("Prompt: %s...", prompt[:100])
             
             # Call Nova Canvas
-            response = self.bedrock_runtime.invoke_model(
-                modelId=self.model_id,
-                body=json.dumps(request_body),
-                contentType='application/json'
-            )
+            async with self._get_limiter():
+                response = await loop.run_in_executor(executor, functools.partial(
+                    self.bedrock_runtime.invoke_model,
+                    modelId=self.model_id,
+                    body=request_body,
+                    contentType='application/json'
+                ))
             
-            # Parse response
-            response_body = json.loads(response['body'].read())
+            # Stream the response body to disk one image at a time
+            saved_paths = await loop.run_in_executor(executor, functools.partial(
+                self._save_images, response['body'], cache_paths, output_paths
+            ))
             
-            if 'images' in response_body and len(response_body['images']) > 0:
-                # Decode base64 image
-                image_data = base64.b64decode(response_body['images'][0])
-                
-                # Save image
-                output_path = os.path.join(self.output_dir, f"{filename}.png")
-                with open(output_path, 'wb') as f:
-                    f.write(image_data)
-                
-                print(f"✅ Image saved: {output_path}")
-                return output_path
+            if len(saved_paths) == len(filenames):
+                return saved_paths
             else:
-                print(f"❌ No image generated for {filename}")
-                return None
+                logger.error("❌ Expected %d image(s), got %d for %s", len(filenames), len(saved_paths), label)
+                return []
                 
         except Exception as e:
-            print(f"❌ Error generating {filename}: {str(e)}")
-            return None
-    
-    def generate_workshop_images(self, delay_seconds=2):
-        """Generate all workshop shirt images"""
-        
-        # Define all prompts for the workshop
-        prompts = [
-            {
-                "filename": "01_basic_white_tshirt",
-                "prompt": "A clean white cotton t-shirt on a plain white background, front view, no wrinkles, studio lighting, product photography style, minimalist, high resolution",
-                "description": "Basic solid color t-shirt"
-            },
-            {
-                "filename": "02_striped_longsleeve",
-                "prompt": "A navy blue and white horizontal striped long-sleeve shirt, crew neck, regular fit, laid flat on white background, professional product photo, even lighting",
-                "description": "Striped long-sleeve shirt"
-            },
-            {
-                "filename": "03_checkered_buttonup",
-                "prompt": "A red and black checkered flannel button-up shirt, classic collar, long sleeves, regular fit, hanging on white background, studio photography",
-                "description": "Checkered button-up shirt"
-            },
-            {
-                "filename": "04_oversized_hoodie",
-                "prompt": "An oversized gray hoodie sweatshirt with hood up, loose fit, kangaroo pocket, long sleeves, on plain background, casual streetwear style",
-                "description": "Oversized hoodie"
-            },
-            {
-                "filename": "05_floral_blouse",
-                "prompt": "A light pink blouse with small white floral pattern, V-neck, short sleeves, fitted silhouette, on white background, feminine style, soft lighting",
-                "description": "Floral print blouse"
-            },
-            {
-                "filename": "06_vintage_band_tshirt",
-                "prompt": "A black vintage-style band t-shirt with distressed graphic print, crew neck, short sleeves, slightly faded, relaxed fit, on neutral background",
-                "description": "Vintage band t-shirt"
-            },
-            {
-                "filename": "07_formal_dress_shirt",
-                "prompt": "A crisp white formal dress shirt, French cuffs, spread collar, long sleeves, slim fit, pressed and neat, professional product photography",
-                "description": "Formal dress shirt"
-            },
-            {
-                "filename": "08_crop_top",
-                "prompt": "A bright yellow crop top, sleeveless, scoop neckline, fitted style, modern casual wear, on clean white background, good lighting",
-                "description": "Crop top"
-            },
-            {
-                "filename": "09_turtleneck_sweater",
-                "prompt": "A burgundy turtleneck sweater, long sleeves, fitted silhouette, ribbed texture, fall/winter style, on neutral background, cozy aesthetic",
-                "description": "Turtleneck sweater"
-            },
-            {
-                "filename": "10_tiedye_tshirt",
-                "prompt": "A tie-dye t-shirt with rainbow spiral pattern, crew neck, short sleeves, regular fit, vibrant colors, casual hippie style, bright lighting",
-                "description": "Tie-dye t-shirt"
-            }
-        ]
-        
-        print(f"🚀 Starting generation of {len(prompts)} workshop images...")
-        print(f"📁 Output directory: {self.output_dir}")
-        print("=" * 60)
-        
-        successful_generations = 0
-        failed_generations = 0
-        
-        for i, prompt_data in enumerate(prompts, 1):
-            print(f"\n[{i}/{len(prompts)}] {prompt_data['description']}")
-            
-            result = self.generate_image(
-                prompt=prompt_data['prompt'],
-                filename=prompt_data['filename'],
-                seed=42  # Fixed seed for reproducibility
-            )
+            logger.exception("❌ Error generating %s: %s", label, e)
+            return []
+    
+    def _restore_cached(self, cache_paths, output_paths):
+        """
+        Copy cached images to their output paths if every one is cached
+        
+        Cache entries are only ever renamed into place once complete, so an
+        existing entry is a whole image.
+        
+        Returns:
+            bool: True if the images were restored from the cache
+        """
+        if not all(os.path.exists(cache_path) for cache_path in cache_paths):
+            return False
+        for cache_path, output_path in zip(cache_paths, output_paths):
+            with open(cache_path, 'rb') as f:
+                _write_file(output_path, f.read())
+            logger.info("♻️  Cached image reused: %s", output_path)
+        return True
+    
+    def _save_images(self, body, cache_paths, output_paths):
+        """
+        Decode the images of a Nova Canvas response straight from its stream
+        
+        The JSON body is parsed incrementally, so only one base64 image is held
+        in memory at a time instead of the whole response plus its decoding.
+        
+        Returns:
+            list: Paths of the saved images
+        """
+        saved_paths = []
+        images = ijson.items(body, 'images.item')
+        for image, cache_path, output_path in zip(images, cache_paths, output_paths):
+            # Save image to the output path, then record it in the cache;
+            # both writes are atomic, so a failure leaves no partial entry
+            image_data = base64.b64decode(image)
+            _write_file(output_path, image_data)
+            _write_file(cache_path, image_data)
             
-            if result:
-                successful_generations += 1
+            logger.info("✅ Image saved: %s", output_path)
+            saved_paths.append(output_path)
+        return saved_paths
+    
+    async def generate_workshop_images(self, prompts=PROMPTS):
+        """
+        Generate all workshop shirt images concurrently
+        
+        Args:
+            prompts (iterable): PromptSpec entries to generate; defaults to
+                the workshop's PROMPTS
+        """
+        prompts = tuple(prompts)
+        if not prompts:
+            logger.info("No prompts to generate")
+            return 0, 0
+        
+        logger.info("🚀 Starting generation of %d workshop images...", len(prompts))
+        logger.info("📁 Output directory: %s", self.output_dir)
+        logger.info("=" * 60)
+        
+        # Prompts that can share a request are generated together
+        groups = []
+        for spec in prompts:
+            for group in groups:
+                if len(group) < MAX_IMAGES_PER_REQUEST and _can_batch(group[0], spec):
+                    group.append(spec)
+                    break
             else:
-                failed_generations += 1
+                groups.append([spec])
+        
+        # The boto3 client is thread-safe, so each worker thread keeps one
+        # Bedrock request in flight
+        max_workers = self.max_parallel_requests
+        if max_workers is None:
+            max_workers = min(len(groups), (os.cpu_count() or 4) * 5)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            coros = [
+                self.generate_images(
+                    prompt=group[0].prompt,
+                    filenames=[spec.filename for spec in group],
+                    seed=42,  # Fixed seed for reproducibility
+                    executor=executor
+                )
+                for group in groups
+            ]
             
-            # Add delay between requests to avoid rate limiting
-            if i < len(prompts):
-                print(f"⏳ Waiting {delay_seconds} seconds...")
-                time.sleep(delay_seconds)
+            # Requests finish in any order, so report one aggregate progress bar
+            results = await atqdm.gather(*coros, desc="Nova Canvas")
+        
+        successful_generations = sum(len(output_paths) for output_paths in results)
+        failed_generations = len(prompts) - successful_generations
         
-        print("\n" + "=" * 60)
-        print(f"🎉 Generation complete!")
-        print(f"✅ Successful: {successful_generations}")
-        print(f"❌ Failed: {failed_generations}")
-        print(f"📁 Images saved in: {self.output_dir}/")
+        logger.info("\n" + "=" * 60)
+        logger.info("🎉 Generation complete!")
+        logger.info("✅ Successful: %d", successful_generations)
+        logger.info("❌ Failed: %d", failed_generations)
+        logger.info("📁 Images saved in: %s/", self.output_dir)
         
         return successful_generations, failed_generations
     
-    def generate_single_test_image(self):
+    async def generate_single_test_image(self):
         """Generate a single test image to verify setup"""
-        print("🧪 Generating test image...")
+        logger.info("🧪 Generating test image...")
         
         test_prompt = "A simple red t-shirt on white background, product photography"
-        result = self.generate_image(
+        result = await self.generate_image(
             prompt=test_prompt,
             filename="test_shirt",
             seed=123
         )
         
         if result:
-            print("✅ Test successful! Nova Canvas is working correctly.")
+            logger.info("✅ Test successful! Nova Canvas is working correctly.")
             return True
         else:
-            print("❌ Test failed. Please check your AWS credentials and permissions.")
+            logger.error("❌ Test failed. Please check your AWS credentials and permissions.")
             return False
 
 def main():
     """Main function to run the image generation"""
     
-    print("Amazon Nova Canvas Workshop Image Generator")
-    print("=" * 50)
+    logger.info("Amazon Nova Canvas Workshop Image Generator")
+    logger.info("=" * 50)
     
     # Initialize generator
     try:
         generator = NovaCanvasImageGenerator()
-        print("✅ Nova Canvas client initialized successfully")
+        logger.info("✅ Nova Canvas client initialized successfully")
     except Exception as e:
-        print(f"❌ Failed to initialize Nova Canvas client: {e}")
-        print("Please check your AWS credentials and region settings.")
+        logger.error("❌ Failed to initialize Nova Canvas client: %s", e)
+        logger.error("Please check your AWS credentials and region settings.")
         return
     
     # Ask user what they want to do
-    print("\nWhat would you like to do?")
-    print("1. Generate test image")
-    print("2. Generate all workshop images")
-    print("3. Both (test first, then all images)")
+    logger.info("\nWhat would you like to do?")
+    logger.info("1. Generate test image")
+    logger.info("2. Generate all workshop images")
+    logger.info("3. Both (test first, then all images)")
     
+    _flush_logs()
     choice = input("\nEnter your choice (1-3): ").strip()
     
     if choice == "1":
-        generator.generate_single_test_image()
+        asyncio.run(generator.generate_single_test_image())
     
     elif choice == "2":
-        generator.generate_workshop_images()
+        asyncio.run(generator.generate_workshop_images())
     
     elif choice == "3":
-        if generator.generate_single_test_image():
-            print("\n" + "=" * 50)
+        if asyncio.run(generator.generate_single_test_image()):
+            logger.info("\n" + "=" * 50)
+            _flush_logs()
             input("Press Enter to continue with full generation...")
-            generator.generate_workshop_images()
+            asyncio.run(generator.generate_workshop_images())
     
     else:
-        print("Invalid choice. Please run the script again.")
+        logger.warning("Invalid choice. Please run the script again.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file